@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -66,6 +69,16 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # Token bucket per user + per endpoint (views set `throttle_scope`).
+    # Over the limit -> 429 with a Retry-After header.
+    # Buckets live in the default cache: set REDIS_URL (see CACHES below) so
+    # all workers share them, otherwise each worker allows the full rate.
+    "DEFAULT_THROTTLE_CLASSES": ("core.throttling.TokenBucketThrottle",),
+    "DEFAULT_THROTTLE_RATES": {
+        "applications": "120/min",
+        "contacts": "120/min",
+        "tasks": "120/min",
+    },
 }
 
 # Dev basics
@@ -103,6 +116,64 @@ DATABASES = {
 }
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+#
+# PASSWORD_HASHER picks the hasher for new passwords (default "pbkdf2").
+# Every hasher stays in the list, so stored hashes made by any of them still
+# verify, and they are re-hashed with the preferred one on the user's next
+# successful login. Use the same value in every process (API and admin).
+# "argon2" / "bcrypt_sha256" need `argon2-cffi` / `bcrypt` installed.
+
+HASHERS = {
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "pbkdf2_sha1": "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "argon2": "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "bcrypt_sha256": "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "scrypt": "django.contrib.auth.hashers.ScryptPasswordHasher",
+}
+PREFERRED_HASHER = os.environ.get("PASSWORD_HASHER", "pbkdf2")
+if PREFERRED_HASHER not in HASHERS:
+    raise ImproperlyConfigured(
+        f"Unknown PASSWORD_HASHER {PREFERRED_HASHER!r}; "
+        f"use one of: {', '.join(HASHERS)}."
+    )
+
+PASSWORD_HASHERS = [
+    HASHERS[PREFERRED_HASHER],
+    *(path for name, path in HASHERS.items() if name != PREFERRED_HASHER),
+]
+
+# How many logins may hash a password at the same time in one process
+# (see core.views.LoginView); extra logins get a 429 right away. Keep it
+# below the number of threads per worker so API requests always have room.
+LOGIN_MAX_CONCURRENT = 2
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# Holds throttle buckets and the token revocation list. These only work
+# across workers if every worker uses the same cache, so production should
+# set REDIS_URL (needs the `redis` package). Without it each process gets
+# its own local memory cache: fine for dev, but then the throttle limit is
+# per worker and revocations only reach the worker that made them.
+
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
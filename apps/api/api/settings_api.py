@@ -0,0 +1,49 @@
+"""
+API-only settings for the api project.
+
+Same as `api.settings`, minus everything a pure JWT API doesn't use:
+- no admin, sessions, messages or staticfiles apps
+- no session / CSRF / message / clickjacking middleware
+- JSON responses only (no browsable API, so no template rendering)
+
+Use it through `api.wsgi_api` / `api.asgi_api`, and serve the admin from a
+separate process running the full `api.settings`.
+
+What this buys is a shorter middleware chain on every request and ~40
+fewer modules loaded. Startup time and memory stay about the same: they
+are mostly Django and DRF themselves, which the API needs either way
+(compare with `python manage.py bench_startup`).
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import REST_FRAMEWORK
+
+INSTALLED_APPS = [
+    # built-in Django apps
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    # third-party apps
+    "rest_framework",
+    "django_filters",
+    "corsheaders",
+    # your apps
+    "core",
+]
+
+MIDDLEWARE = [
+    "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+}
+
+ROOT_URLCONF = "api.urls_api"
+
+# Nothing here renders HTML templates.
+TEMPLATES = []
+
+WSGI_APPLICATION = "api.wsgi_api.application"
@@ -16,25 +16,10 @@ Including another URLconf
 """
 
 from django.contrib import admin
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from rest_framework_nested.routers import NestedDefaultRouter
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from core.views import ApplicationViewSet, ContactViewSet, TaskViewSet
-
-# Top-level router
-router = DefaultRouter()
-router.register(r"applications", ApplicationViewSet, basename="application")
-
-# Nested routers under /api/applications/{application_pk}/...
-nested = NestedDefaultRouter(router, r"applications", lookup="application")
-nested.register(r"contacts", ContactViewSet, basename="application-contacts")
-nested.register(r"tasks", TaskViewSet, basename="application-tasks")
+from django.urls import path
+from .urls_api import urlpatterns as api_urlpatterns
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("api/", include(router.urls)),  # /api/applications/
-    path("api/", include(nested.urls)),  # /api/applications/{id}/contacts/, /tasks/
-    path("api/auth/login/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
-    path("api/auth/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    *api_urlpatterns,
 ]
@@ -0,0 +1,34 @@
+"""
+API-only URL configuration (used by `api.settings_api`).
+
+Everything under /api/. The full `api.urls` adds the admin on top of this.
+"""
+
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from rest_framework_nested.routers import NestedDefaultRouter
+from core.views import (
+    ApplicationViewSet,
+    ContactViewSet,
+    LoginView,
+    LogoutView,
+    RefreshView,
+    TaskViewSet,
+)
+
+# Top-level router
+router = DefaultRouter()
+router.register(r"applications", ApplicationViewSet, basename="application")
+
+# Nested routers under /api/applications/{application_pk}/...
+nested = NestedDefaultRouter(router, r"applications", lookup="application")
+nested.register(r"contacts", ContactViewSet, basename="application-contacts")
+nested.register(r"tasks", TaskViewSet, basename="application-tasks")
+
+urlpatterns = [
+    path("api/", include(router.urls)),  # /api/applications/
+    path("api/", include(nested.urls)),  # /api/applications/{id}/contacts/, /tasks/
+    path("api/auth/login/", LoginView.as_view(), name="token_obtain_pair"),
+    path("api/auth/refresh/", RefreshView.as_view(), name="token_refresh"),
+    path("api/auth/logout/", LogoutView.as_view(), name="token_logout"),
+]
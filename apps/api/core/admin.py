@@ -1,5 +1,7 @@
 from django.contrib import admin
+from .admin_filters import CompanyFilter, UserFilter
 from .models import Application, Contact, Task
+from .pagination import EstimatedCountPaginator
 
 
 @admin.register(Application)
@@ -12,12 +14,26 @@ class ApplicationAdmin(admin.ModelAdmin):
     # (Makes it easier to see important info at a glance.)
     list_display = ("title", "company", "status", "user", "created_at")
 
+    # Load the user in the same query (instead of one query per row).
+    list_select_related = ("user",)
+
     # Filters shown on the right side in the admin.
     # (Lets you quickly narrow down applications.)
-    list_filter = ("status", "company", "created_at")
+    # Company/user are text boxes, not a list of every distinct value.
+    list_filter = ("status", CompanyFilter, UserFilter, "created_at")
 
     # Fields that can be searched with the search box at the top.
-    search_fields = ("status", "company", "stage", "source", "location")
+    # "^" = starts with, "=" = exact, so the search can use the indexes from
+    # migration 0002 (a "contains" search would scan the whole table).
+    search_fields = ("^title", "^company", "=status", "^stage", "^source", "^location")
+
+    # Pick the user with a search box instead of a huge dropdown.
+    autocomplete_fields = ("user",)
+
+    # Big tables: estimate the total instead of counting every row,
+    # and don't run a second count for "N total" when filtering.
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Contact)
@@ -29,8 +45,17 @@ class ContactAdmin(admin.ModelAdmin):
     # Show these fields in the list of contacts.
     list_display = ("name", "role", "email", "application")
 
-    # Allow searching by these fields.
-    search_fields = ("name", "email", "role")
+    # Load the application in the same query (instead of one query per row).
+    list_select_related = ("application",)
+
+    # Allow searching by these fields ("^" = starts with, uses an index).
+    search_fields = ("^name", "^email", "^role")
+
+    # Pick the application with a search box instead of a huge dropdown.
+    autocomplete_fields = ("application",)
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Task)
@@ -42,8 +67,17 @@ class TaskAdmin(admin.ModelAdmin):
     # Show these fields in the list of tasks.
     list_display = ("title", "application", "due_date", "done", "created_at")
 
+    # Load the application in the same query (instead of one query per row).
+    list_select_related = ("application",)
+
     # Add a filter for "done" so you can see finished vs unfinished tasks.
     list_filter = ("done",)
 
-    # Allow searching by task title.
-    search_fields = ("title",)
+    # Allow searching by task title ("^" = starts with, uses an index).
+    search_fields = ("^title",)
+
+    # Pick the application with a search box instead of a huge dropdown.
+    autocomplete_fields = ("application",)
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -0,0 +1,64 @@
+from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
+
+
+class InputFilter(admin.SimpleListFilter):
+    """
+    A list filter with a text box instead of a list of links.
+
+    The normal filters build their list from `SELECT DISTINCT ...` over the
+    whole table, which is slow on big tables and unusable with thousands of
+    companies. Here the admin just types the value they want.
+    """
+
+    template = "admin/input_filter.html"
+    placeholder = ""
+
+    def lookups(self, request, model_admin):
+        # The filter is only shown if there's at least one choice.
+        # The template draws a text box instead, so this is never listed.
+        return (("", ""),)
+
+    def get_facet_counts(self, pk_attname, filtered_qs):
+        # No fixed choices, so nothing to count.
+        return {}
+
+    def choices(self, changelist):
+        # Only the "All" choice is needed (for the "Clear" link), plus the
+        # other query params (filters, search, ordering) so the form keeps
+        # them when submitted. The page number is dropped on purpose.
+        all_choice = next(super().choices(changelist))
+        all_choice["query_parts"] = [
+            (name, value)
+            for name, values in changelist.params.items()
+            if name not in (self.parameter_name, PAGE_VAR)
+            for value in (values if isinstance(values, list) else [values])
+        ]
+        yield all_choice
+
+
+class CompanyFilter(InputFilter):
+    """Applications whose company starts with the typed text."""
+
+    title = "company"
+    parameter_name = "company"
+    placeholder = "Company starts with…"
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(company__istartswith=self.value())
+        return queryset
+
+
+class UserFilter(InputFilter):
+    """Applications owned by the user with this exact username."""
+
+    title = "user"
+    parameter_name = "username"
+    placeholder = "Username"
+
+    def queryset(self, request, queryset):
+        if self.value():
+            # Exact match uses the unique index on username.
+            return queryset.filter(user__username=self.value())
+        return queryset
@@ -0,0 +1,130 @@
+import threading
+
+from django.core.cache import cache
+from rest_framework.response import Response
+
+# Per-user write counter (see CoalescedReadMixin). Lives in the default
+# cache so writes made by any worker are seen by all of them.
+WRITE_GENERATION_KEY = "read_generation_%s"
+
+
+class _Call:
+    """One in-flight request that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Make sure only one thread does the same piece of work at a time.
+
+    The first caller for a key runs the function. Anyone else who asks for
+    the same key while it is still running waits and gets the same result
+    (or the same error), instead of doing the work again.
+
+    Followers wait at most `timeout` seconds; if the first caller is stuck,
+    they give up waiting and do the work themselves.
+
+    Only threads of the same process can share work, so this helps with
+    threaded workers (e.g. gunicorn `--worker-class gthread`), not with
+    one-request-per-process sync workers.
+    """
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            # Forget the key first so later requests start a fresh call.
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+# Shared by every view in this worker process.
+_reads = SingleFlight()
+
+
+def write_generation(user_id):
+    """How many writes this user has made (as far as the cache remembers)."""
+    return cache.get(WRITE_GENERATION_KEY % user_id, 0)
+
+
+def bump_write_generation(user_id):
+    """Record a write, so later GETs don't join reads that started before it."""
+    key = WRITE_GENERATION_KEY % user_id
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Not in the cache yet (or evicted): any new value differs from
+        # the generation reads in flight were keyed with.
+        cache.set(key, write_generation(user_id) + 1, None)
+
+
+class CoalescedReadMixin:
+    """
+    Share one DB query + serialization between identical concurrent GETs.
+
+    Requests are "identical" when they come from the same user for the same
+    URL (path + query string), and no write by that user happened in between:
+    every create/update/delete bumps the user's write generation, which is
+    part of the key. So a GET sent after a PATCH never gets the result of a
+    read that started before it.
+
+    Each request still gets its own Response, so rendering (JSON, browsable
+    API, ...) is done per request.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._coalesce(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._coalesce(super().retrieve, request, *args, **kwargs)
+
+    # The write actions wrap perform_create/update/destroy (which the views
+    # override), so bumping here covers all of them, including PATCH.
+    def create(self, request, *args, **kwargs):
+        response = super().create(request, *args, **kwargs)
+        bump_write_generation(request.user.pk)
+        return response
+
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        bump_write_generation(request.user.pk)
+        return response
+
+    def destroy(self, request, *args, **kwargs):
+        response = super().destroy(request, *args, **kwargs)
+        bump_write_generation(request.user.pk)
+        return response
+
+    def _coalesce(self, handler, request, *args, **kwargs):
+        user_id = request.user.pk
+        key = (user_id, write_generation(user_id), request.get_full_path())
+        shared = _reads.do(key, lambda: handler(request, *args, **kwargs))
+        return Response(shared.data, status=shared.status_code)
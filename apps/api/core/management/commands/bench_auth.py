@@ -0,0 +1,103 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test.utils import setup_databases, teardown_databases
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from core.views import LoginView, RefreshView
+
+PASSWORD = "bench-password-123"
+
+
+class Command(BaseCommand):
+    """
+    Measure login and refresh throughput.
+
+    Runs against a throwaway test database (set up and torn down like
+    `manage.py test` does), so it never touches real data.
+    Compares SimpleJWT's stock views with ours.
+
+    Requests rejected with 429 (our login only admits a few at a time) are
+    retried until they succeed, so "ok/s" is completed logins per second;
+    the "429s" column shows how many rejections that took.
+
+    Example:
+        python manage.py bench_auth --requests 200 --concurrency 8
+    """
+
+    help = "Benchmark login and token refresh throughput."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=100)
+        parser.add_argument("--concurrency", type=int, default=4)
+
+    def handle(self, *args, **options):
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            self.run(options["requests"], options["concurrency"])
+        finally:
+            connections.close_all()
+            teardown_databases(old_config, verbosity=0)
+
+    def run(self, total, concurrency):
+        user = get_user_model().objects.create_user("bench", password=PASSWORD)
+        refresh = str(RefreshToken.for_user(user))
+        factory = APIRequestFactory()
+
+        def login_request():
+            return factory.post(
+                "/api/auth/login/",
+                {"username": "bench", "password": PASSWORD},
+                format="json",
+            )
+
+        def refresh_request():
+            return factory.post(
+                "/api/auth/refresh/", {"refresh": refresh}, format="json"
+            )
+
+        cases = [
+            ("login (stock)", TokenObtainPairView.as_view(), login_request),
+            ("login (slots)", LoginView.as_view(), login_request),
+            ("refresh (stock)", TokenRefreshView.as_view(), refresh_request),
+            ("refresh (cached)", RefreshView.as_view(), refresh_request),
+        ]
+
+        self.stdout.write(f"{total} requests, {concurrency} threads")
+        self.stdout.write(
+            f"{'':<18} {'ok/s':>8}  {'time':>7}  {'failed':>6}  {'429s':>6}"
+        )
+        for name, view, make_request in cases:
+            elapsed, ok, rejected = self.time(view, make_request, total, concurrency)
+            self.stdout.write(
+                f"{name:<18} {ok / elapsed:8.1f}  {elapsed:6.2f}s  "
+                f"{total - ok:>6}  {rejected:>6}"
+            )
+
+    def time(self, view, make_request, total, concurrency):
+        def call(_):
+            rejected = 0
+            try:
+                while True:
+                    code = view(make_request()).status_code
+                    if code != 429:
+                        return code, rejected
+                    rejected += 1
+                    time.sleep(0.01)
+            finally:
+                # Each pool thread opened its own DB connection.
+                connections.close_all()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(call, range(total)))
+        elapsed = time.perf_counter() - start
+
+        ok = sum(code == 200 for code, _rejected in results)
+        rejected = sum(rejected for _code, rejected in results)
+        return elapsed, ok, rejected
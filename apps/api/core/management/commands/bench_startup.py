@@ -0,0 +1,89 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# (name, settings module, WSGI module)
+PROFILES = [
+    ("full", "api.settings", "api.wsgi"),
+    ("api-only", "api.settings_api", "api.wsgi_api"),
+]
+
+# Runs in a fresh interpreter: load the WSGI app, serve one request
+# (unauthenticated, so no DB is needed) and report timings + peak memory.
+CHILD = """
+import importlib, json, resource, sys, time
+from wsgiref.util import setup_testing_defaults
+
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+loaded = time.perf_counter()
+
+environ = {"PATH_INFO": "/api/applications/"}
+setup_testing_defaults(environ)
+response = module.application(environ, lambda status, headers: None)
+b"".join(response)
+response.close()
+served = time.perf_counter()
+
+print(json.dumps({
+    "startup": loaded - start,
+    "first_request": served - loaded,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+}))
+"""
+
+
+class Command(BaseCommand):
+    """
+    Compare cold start time and memory of the full and API-only profiles.
+
+    Each run starts a new Python process, so nothing is cached between runs.
+    Numbers are medians over `--runs`.
+
+    Example:
+        python manage.py bench_startup --runs 10
+    """
+
+    help = "Benchmark startup time and RSS of the full vs API-only profile."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        runs = options["runs"]
+        self.stdout.write(f"{runs} runs per profile (medians)")
+        self.stdout.write(
+            f"{'profile':<10} {'startup':>10} {'1st req':>10} {'RSS':>10} "
+            f"{'modules':>8}"
+        )
+
+        for name, settings_module, wsgi_module in PROFILES:
+            results = [self.measure(settings_module, wsgi_module) for _ in range(runs)]
+
+            def median(key):
+                return statistics.median(result[key] for result in results)
+
+            self.stdout.write(
+                f"{name:<10} {median('startup') * 1000:>8.0f}ms "
+                f"{median('first_request') * 1000:>8.0f}ms "
+                f"{median('rss_kb') / 1024:>8.1f}MB "
+                f"{median('modules'):>8.0f}"
+            )
+
+    def measure(self, settings_module, wsgi_module):
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD, wsgi_module],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return json.loads(output)
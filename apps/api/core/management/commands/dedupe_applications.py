@@ -0,0 +1,135 @@
+from itertools import groupby
+from operator import itemgetter
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import Application, Contact, Task
+from core.normalize import similarity, trigrams
+
+
+class Command(BaseCommand):
+    """
+    Find near-duplicate applications for every user.
+
+    Instead of comparing every pair of rows, rows are streamed in
+    (user, company_key) order and only compared inside each small block
+    ("blocking"). Inside a block, titles with the same normalized key are
+    exact duplicates; different titles are grouped as *similar* when their
+    trigram similarity to every title in the group is above `--threshold`.
+
+    By default it only reports. `--delete` only touches exact duplicates:
+    it keeps the oldest one, moves the others' contacts and tasks onto it,
+    then deletes the others. Similar (non-exact) titles are never deleted.
+
+    Example:
+        python manage.py dedupe_applications --threshold 0.85
+    """
+
+    help = "Find near-duplicate applications (and optionally merge exact ones)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.8,
+            help="Title trigram similarity (0-1) to count as similar.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows fetched per round trip.",
+        )
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Merge exact duplicates into the oldest one.",
+        )
+
+    def handle(self, *args, **options):
+        # Streamed in chunks; ordering matches the (user, company_key, ...)
+        # index, so each block arrives in one piece.
+        rows = (
+            Application.objects.order_by("user_id", "company_key", "id")
+            .values_list("id", "user_id", "company_key", "title_key")
+            .iterator(chunk_size=options["batch_size"])
+        )
+
+        similar_groups = 0
+        merges = []  # (kept id, [duplicate ids]) for exact duplicates
+        for (user_id, company_key), block in groupby(rows, key=itemgetter(1, 2)):
+            # Empty keys (e.g. a company of only punctuation) prove nothing.
+            if not company_key:
+                continue
+            for group in find_duplicates(block, options["threshold"]):
+                label = f"user {user_id} · {company_key!r}"
+
+                if len(group) > 1:
+                    similar_groups += 1
+                    titles = ", ".join(f"#{min(ids)} {title!r}" for title, ids in group)
+                    self.stdout.write(f"{label}: similar titles {titles}")
+
+                for title, ids in group:
+                    if len(ids) > 1:
+                        keep, *extra = sorted(ids)
+                        merges.append((keep, extra))
+                        self.stdout.write(
+                            f"{label}: {title!r} keep #{keep}, "
+                            f"exact duplicates {', '.join(f'#{pk}' for pk in extra)}"
+                        )
+
+        extra_count = sum(len(extra) for _keep, extra in merges)
+        self.stdout.write(
+            f"Found {len(merges)} exact duplicate groups ({extra_count} extra "
+            f"applications) and {similar_groups} groups of similar titles."
+        )
+
+        if options["delete"] and merges:
+            for keep, extra in merges:
+                merge_into(keep, extra)
+            self.stdout.write(
+                self.style.SUCCESS(f"Merged and deleted {extra_count} applications.")
+            )
+
+
+def merge_into(keep, extra):
+    """Move contacts/tasks of the `extra` applications to `keep`, then delete them."""
+    with transaction.atomic():
+        Contact.objects.filter(application_id__in=extra).update(application_id=keep)
+        Task.objects.filter(application_id__in=extra).update(application_id=keep)
+        Application.objects.filter(id__in=extra).delete()
+
+
+def find_duplicates(block, threshold):
+    """
+    Group the rows of one (user, company) block.
+
+    Returns a list of groups; each group is a list of (title_key, ids).
+    A group with one title is only returned if it has 2+ ids (exact
+    duplicates). A group with several titles holds titles that are all
+    similar to each other; titles only join a group if they match *every*
+    title in it, so "A ~ B ~ C" doesn't chain A and C together.
+    """
+    ids_by_title = {}
+    for pk, _user_id, _company_key, title_key in block:
+        if not title_key:
+            continue
+        ids_by_title.setdefault(title_key, []).append(pk)
+
+    groups = []  # [(title trigrams, [(title_key, ids), ...]), ...]
+    for title, ids in ids_by_title.items():
+        grams = trigrams(title)
+        for members in groups:
+            if all(similarity(grams, other) >= threshold for other in members[0]):
+                members[0].append(grams)
+                members[1].append((title, ids))
+                break
+        else:
+            groups.append(([grams], [(title, ids)]))
+
+    return [
+        members
+        for _grams, members in groups
+        if len(members) > 1 or len(members[0][1]) > 1
+    ]
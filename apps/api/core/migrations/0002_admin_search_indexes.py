@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# Admin search uses "starts with" / "exact" lookups, which Django turns into
+# `UPPER(col::text) LIKE UPPER('abc%')` / `UPPER(col::text) = UPPER('abc')`.
+# On PostgreSQL a normal index can't serve that (unless the DB uses the "C"
+# collation), so add matching expression indexes with `text_pattern_ops`.
+#
+# The indexes are built CONCURRENTLY so big tables stay writable meanwhile;
+# that can't run in a transaction, hence `atomic = False`.
+SEARCH_INDEXES = [
+    ("core_application", "title", "core_applic_title_upper_like"),
+    ("core_application", "company", "core_applic_company_upper_like"),
+    ("core_application", "status", "core_applic_status_upper_like"),
+    ("core_application", "stage", "core_applic_stage_upper_like"),
+    ("core_application", "source", "core_applic_source_upper_like"),
+    ("core_application", "location", "core_applic_location_upper_like"),
+    ("core_contact", "name", "core_contact_name_upper_like"),
+    ("core_contact", "email", "core_contact_email_upper_like"),
+    ("core_contact", "role", "core_contact_role_upper_like"),
+    ("core_task", "title", "core_task_title_upper_like"),
+]
+
+
+class PostgresRunSQL(migrations.RunSQL):
+    """RunSQL that only runs on PostgreSQL (e.g. SQLite in dev skips it)."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        PostgresRunSQL(
+            sql=(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+                f'ON "{table}" (UPPER("{column}"::text) text_pattern_ops)'
+            ),
+            reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"',
+        )
+        for table, column, name in SEARCH_INDEXES
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+from core.normalize import normalize_company, normalize_title
+
+# The table can hold millions of rows, so this migration is not atomic:
+# - each backfill batch commits on its own (no single huge transaction)
+# - on PostgreSQL the index is built CONCURRENTLY, so writes keep going
+BATCH_SIZE = 2000
+KEY_LENGTH = 200
+
+DEDUPE_INDEX = models.Index(
+    fields=["user", "company_key", "title_key"],
+    name="core_applic_user_id_2ffe10_idx",
+)
+
+
+def fill_keys(apps, schema_editor):
+    """Fill company_key/title_key for existing rows, a batch at a time."""
+    Application = apps.get_model("core", "Application")
+    rows = Application.objects.only("id", "company", "title").order_by("id")
+
+    last_id = 0
+    while True:
+        batch = list(rows.filter(id__gt=last_id)[:BATCH_SIZE])
+        if not batch:
+            break
+        for app in batch:
+            app.company_key = normalize_company(app.company)[:KEY_LENGTH]
+            app.title_key = normalize_title(app.title)[:KEY_LENGTH]
+        Application.objects.bulk_update(batch, ["company_key", "title_key"])
+        last_id = batch[-1].id
+
+
+def add_dedupe_index(apps, schema_editor):
+    Application = apps.get_model("core", "Application")
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.add_index(Application, DEDUPE_INDEX, concurrently=True)
+    else:
+        schema_editor.add_index(Application, DEDUPE_INDEX)
+
+
+def remove_dedupe_index(apps, schema_editor):
+    Application = apps.get_model("core", "Application")
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(Application, DEDUPE_INDEX, concurrently=True)
+    else:
+        schema_editor.remove_index(Application, DEDUPE_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("core", "0002_admin_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="application",
+            name="company_key",
+            field=models.CharField(default="", editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name="application",
+            name="title_key",
+            field=models.CharField(default="", editable=False, max_length=200),
+        ),
+        migrations.RunPython(fill_keys, migrations.RunPython.noop),
+        # The model state records a normal AddIndex; the database gets it
+        # through add_dedupe_index (concurrently on PostgreSQL).
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="application", index=DEDUPE_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_dedupe_index, remove_dedupe_index),
+            ],
+        ),
+    ]
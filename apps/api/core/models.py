@@ -1,5 +1,10 @@
 from django.conf import settings
 from django.db import models
+from .normalize import normalize_company, normalize_title
+
+# Length of Application.company_key / title_key. Normalizing can make text
+# longer ("ß" -> "ss"), so keys are cut to fit.
+KEY_LENGTH = 200
 
 
 class Application(models.Model):
@@ -50,6 +55,11 @@ class Application(models.Model):
     created_at = models.DateField(auto_now_add=True)  # Set when created
     updated_at = models.DateTimeField(auto_now=True)  # Updated every save
 
+    # Normalized copies of company/title (e.g. "Acme, Inc." -> "acme"),
+    # kept up to date in save(). Used to spot duplicate applications.
+    company_key = models.CharField(max_length=KEY_LENGTH, editable=False, default="")
+    title_key = models.CharField(max_length=KEY_LENGTH, editable=False, default="")
+
     class Meta:
         """
         Extra settings for the model:
@@ -62,12 +72,36 @@ class Application(models.Model):
             models.Index(fields=["user", "status"]),
             models.Index(fields=["company"]),
             models.Index(fields=["created_at"]),
+            # Duplicate check: "does this user already have this job?"
+            models.Index(fields=["user", "company_key", "title_key"]),
         ]
 
     def __str__(self) -> str:
         """How this object shows up as text (useful in the admin)."""
         return f"{self.title} @ {self.company}"
 
+    @staticmethod
+    def dedupe_keys(company, title):
+        """Normalized (company_key, title_key), cut to fit their columns."""
+        return (
+            normalize_company(company)[:KEY_LENGTH],
+            normalize_title(title)[:KEY_LENGTH],
+        )
+
+    def save(self, *args, **kwargs):
+        """
+        Refresh the normalized keys before saving.
+        (Note: bulk_create() and queryset.update() skip this.)
+        """
+        self.company_key, self.title_key = self.dedupe_keys(self.company, self.title)
+
+        # If only some fields are saved, make sure the keys go along.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "company_key", "title_key"}
+
+        super().save(*args, **kwargs)
+
 
 class Contact(models.Model):
     """
@@ -0,0 +1,76 @@
+import re
+import unicodedata
+
+# Endings that don't make two companies different ("Acme Inc." == "Acme").
+COMPANY_SUFFIXES = {
+    "co",
+    "company",
+    "corp",
+    "corporation",
+    "gmbh",
+    "inc",
+    "incorporated",
+    "limited",
+    "llc",
+    "ltd",
+    "plc",
+}
+
+# Anything that isn't a letter or digit (in any script) splits words.
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _strip_accents(value):
+    """
+    "Société" -> "Societe". Only marks on Latin letters are dropped, so
+    other scripts keep theirs (e.g. the dakuten in "ゴ").
+    """
+    kept = []
+    for char in unicodedata.normalize("NFKD", value):
+        if unicodedata.combining(char) and kept and kept[-1].isascii():
+            continue
+        kept.append(char)
+    return unicodedata.normalize("NFC", "".join(kept))
+
+
+def _words(value):
+    """Casefold, drop accents and punctuation, split into words."""
+    value = _strip_accents(value or "").casefold()
+    return _NON_WORD.sub(" ", value).split()
+
+
+def normalize_company(value):
+    """
+    "Acme, Inc." -> "acme", "Société Générale" -> "societe generale",
+    "ソニー株式会社" stays as is.
+    """
+    words = _words(value)
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_title(value):
+    """
+    "Sr. Backend-Engineer " -> "sr backend engineer".
+    """
+    return " ".join(_words(value))
+
+
+def trigrams(value):
+    """
+    The set of 3-letter chunks of each word, like PostgreSQL's pg_trgm
+    (each word is padded with two spaces in front and one at the end).
+    """
+    grams = set()
+    for word in value.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a, b):
+    """Share of trigrams two sets have in common (0 = nothing, 1 = same)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -0,0 +1,49 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that skips `COUNT(*)` on big unfiltered tables.
+
+    On PostgreSQL, `COUNT(*)` reads the whole table. For an unfiltered list
+    we use the planner's row estimate (`pg_class.reltuples`) instead, which
+    is instant and close enough for page links.
+
+    Small tables, filtered lists and other databases use the exact count.
+    """
+
+    # Below this many (estimated) rows an exact count is cheap enough.
+    exact_count_limit = 10_000
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None and estimate > self.exact_count_limit:
+            return estimate
+        return super().count
+
+    def _estimated_count(self):
+        queryset = self.object_list
+        query = getattr(queryset, "query", None)
+
+        # Only plain "whole table" querysets can use the table estimate.
+        if query is None or query.where:
+            return None
+
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # reltuples is -1 if the table was never analyzed.
+        if row is None or row[0] < 0:
+            return None
+        return int(row[0])
@@ -48,10 +48,56 @@ class ApplicationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Application
-        fields = "__all__"
+        # company_key / title_key are internal (used by the duplicate check).
+        exclude = ("company_key", "title_key")
 
         # Fields that are not editable by the client:
         # - id: auto-generated
         # - user: set by the view (request.user)
         # - created_at / updated_at: managed automatically
         read_only_fields = ("id", "user", "created_at", "updated_at")
+
+    def validate(self, attrs):
+        """
+        Stop the same user from adding the same job twice.
+        Compares normalized company + title ("Acme, Inc." == "acme"),
+        using the (user, company_key, title_key) index.
+        """
+        attrs = super().validate(attrs)
+
+        # Only when company or title is being set (so e.g. a status change
+        # on an application that already has a duplicate still works).
+        if "company" not in attrs and "title" not in attrs:
+            return attrs
+
+        # On partial updates, fall back to the values already saved.
+        company_key, title_key = Application.dedupe_keys(
+            attrs.get("company", getattr(self.instance, "company", "")),
+            attrs.get("title", getattr(self.instance, "title", "")),
+        )
+
+        # Nothing left to compare (e.g. only punctuation).
+        if not company_key or not title_key:
+            return attrs
+
+        # Same job as before after normalizing: nothing new to check.
+        if self.instance is not None and (company_key, title_key) == (
+            self.instance.company_key,
+            self.instance.title_key,
+        ):
+            return attrs
+
+        duplicates = Application.objects.filter(
+            user=self.context["request"].user,
+            company_key=company_key,
+            title_key=title_key,
+        )
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+
+        if duplicates.exists():
+            raise serializers.ValidationError(
+                "You already have an application for this job at this company."
+            )
+
+        return attrs
@@ -1 +1,498 @@
-# Create your tests here.
+import threading
+import time
+from io import StringIO
+from itertools import combinations
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from . import coalescing, views
+from .coalescing import SingleFlight
+from .management.commands.dedupe_applications import find_duplicates
+from .models import Application, Contact, Task
+from .pagination import EstimatedCountPaginator
+from .normalize import normalize_company, normalize_title, similarity, trigrams
+from .throttling import TokenBucketThrottle
+
+User = get_user_model()
+
+PASSWORD = "correct-horse-battery"
+
+
+class TokenBucketThrottleTests(SimpleTestCase):
+    """core.throttling"""
+
+    rates = {"applications": "3/min", "tasks": "3/min"}
+
+    def setUp(self):
+        cache.clear()
+        self.now = 1000.0
+        patches = [
+            mock.patch.object(TokenBucketThrottle, "THROTTLE_RATES", self.rates),
+            mock.patch.object(
+                TokenBucketThrottle, "timer", mock.Mock(side_effect=lambda: self.now)
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def allow(self, user_id=1, scope="applications"):
+        request = SimpleNamespace(
+            user=SimpleNamespace(is_authenticated=True, pk=user_id)
+        )
+        view = SimpleNamespace(throttle_scope=scope)
+        throttle = TokenBucketThrottle()
+        return throttle.allow_request(request, view), throttle
+
+    def test_empty_bucket_rejects_with_wait(self):
+        for _ in range(3):
+            self.assertTrue(self.allow()[0])
+
+        allowed, throttle = self.allow()
+        self.assertFalse(allowed)
+        # 3/min refills one token every 20 seconds.
+        self.assertAlmostEqual(throttle.wait(), 20)
+
+    def test_bucket_refills_over_time(self):
+        for _ in range(3):
+            self.allow()
+        self.assertFalse(self.allow()[0])
+
+        self.now += 20
+        self.assertTrue(self.allow()[0])
+        self.assertFalse(self.allow()[0])
+
+    def test_buckets_are_per_user_and_per_scope(self):
+        for _ in range(3):
+            self.allow()
+        self.assertFalse(self.allow()[0])
+
+        self.assertTrue(self.allow(user_id=2)[0])
+        self.assertTrue(self.allow(scope="tasks")[0])
+
+    def test_view_without_scope_is_not_limited(self):
+        for _ in range(10):
+            self.assertTrue(self.allow(scope=None)[0])
+
+
+class ThrottledApiTests(APITestCase):
+    """Throttling as seen by API clients."""
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(User.objects.create_user("alice"))
+
+    def test_empty_bucket_returns_429_with_retry_after(self):
+        rates = {"applications": "2/min"}
+        with mock.patch.object(TokenBucketThrottle, "THROTTLE_RATES", rates):
+            for _ in range(2):
+                response = self.client.get(reverse("application-list"))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            response = self.client.get(reverse("application-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response.headers["Retry-After"], "30")
+
+
+class SingleFlightTests(SimpleTestCase):
+    """core.coalescing.SingleFlight"""
+
+    def run_together(self, flight, fn, followers=3):
+        """Start a leader running `fn`, then `followers` callers for the same key."""
+        release = threading.Event()
+        results = []
+
+        def leader_fn():
+            release.wait(5)
+            return fn()
+
+        def call(work):
+            try:
+                results.append(flight.do("key", work))
+            except Exception as exc:
+                results.append(exc)
+
+        threads = [threading.Thread(target=call, args=(leader_fn,))]
+        threads[0].start()
+        while "key" not in flight._calls:
+            time.sleep(0.001)
+
+        calls = []
+        for _ in range(followers):
+            thread = threading.Thread(target=call, args=(lambda: calls.append(1),))
+            thread.start()
+            threads.append(thread)
+
+        time.sleep(0.05)  # let the followers start waiting
+        release.set()
+        for thread in threads:
+            thread.join()
+        return results, calls
+
+    def test_followers_get_leader_result(self):
+        results, follower_calls = self.run_together(SingleFlight(), lambda: 42)
+
+        self.assertEqual(results, [42] * 4)
+        self.assertEqual(follower_calls, [])
+
+    def test_followers_get_leader_exception(self):
+        error = ValueError("boom")
+
+        def fail():
+            raise error
+
+        results, follower_calls = self.run_together(SingleFlight(), fail)
+
+        self.assertEqual(results, [error] * 4)
+        self.assertEqual(follower_calls, [])
+
+    def test_followers_stop_waiting_after_timeout(self):
+        flight = SingleFlight(timeout=0.01)
+        release = threading.Event()
+        leader = threading.Thread(target=flight.do, args=("key", release.wait))
+        leader.start()
+        while "key" not in flight._calls:
+            time.sleep(0.001)
+
+        try:
+            self.assertEqual(flight.do("key", lambda: "own"), "own")
+        finally:
+            release.set()
+            leader.join()
+
+
+class CoalescedReadTests(APITestCase):
+    """core.coalescing.CoalescedReadMixin"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("alice")
+        self.client.force_authenticate(self.user)
+        self.app = Application.objects.create(user=self.user, title="Dev", company="A")
+        self.url = reverse("application-detail", args=[self.app.pk])
+
+    def test_get_after_write_does_not_join_older_read(self):
+        # Pretend a read of this URL started before the write and is still
+        # in flight (finished, but not yet forgotten).
+        flight = SingleFlight()
+        stale = coalescing._Call()
+        stale.result = Response({"status": "stale"})
+        stale.done.set()
+        flight._calls[(self.user.pk, 0, self.url)] = stale
+
+        with mock.patch.object(coalescing, "_reads", flight):
+            self.assertEqual(self.client.get(self.url).data["status"], "stale")
+
+            self.client.patch(self.url, {"status": "interview"}, format="json")
+
+            self.assertEqual(self.client.get(self.url).data["status"], "interview")
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    """core.pagination.EstimatedCountPaginator"""
+
+    def setUp(self):
+        user = User.objects.create_user("alice")
+        for title in ("Dev", "QA"):
+            Application.objects.create(user=user, title=title, company="Acme")
+
+    def count(self, queryset, vendor="postgresql", reltuples=50_000):
+        cursor = mock.MagicMock()
+        cursor.fetchone.return_value = (reltuples,)
+        db = mock.MagicMock(vendor=vendor)
+        db.cursor.return_value.__enter__.return_value = cursor
+
+        with mock.patch("core.pagination.connections", {"default": db}):
+            count = EstimatedCountPaginator(queryset, 10).count
+        return count, cursor
+
+    def test_big_unfiltered_table_uses_estimate(self):
+        count, cursor = self.count(Application.objects.all())
+
+        self.assertEqual(count, 50_000)
+        cursor.execute.assert_called_once()
+
+    def test_filtered_queryset_counts_exactly(self):
+        count, cursor = self.count(Application.objects.filter(title="Dev"))
+
+        self.assertEqual(count, 1)
+        cursor.execute.assert_not_called()
+
+    def test_other_databases_count_exactly(self):
+        count, cursor = self.count(Application.objects.all(), vendor="sqlite")
+
+        self.assertEqual(count, 2)
+        cursor.execute.assert_not_called()
+
+    def test_never_analyzed_table_counts_exactly(self):
+        count, _cursor = self.count(Application.objects.all(), reltuples=-1)
+
+        self.assertEqual(count, 2)
+
+    def test_small_table_counts_exactly(self):
+        count, _cursor = self.count(Application.objects.all(), reltuples=500)
+
+        self.assertEqual(count, 2)
+
+
+class AdminInputFilterTests(TestCase):
+    """core.admin_filters.InputFilter"""
+
+    def setUp(self):
+        admin = User.objects.create_superuser("root", "root@example.com", "pw")
+        self.client.force_login(admin)
+
+    def test_form_keeps_other_params_and_drops_page(self):
+        response = self.client.get(
+            "/admin/core/application/?company=ac&username=x&q=dev&p=1"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Company filter box: keeps the username filter and the search.
+        self.assertContains(response, '<input type="text" name="company" value="ac"')
+        self.assertContains(response, '<input type="hidden" name="username" value="x"')
+        self.assertContains(response, '<input type="hidden" name="q" value="dev"')
+        self.assertNotContains(response, '<input type="hidden" name="p"')
+
+    def test_filters_narrow_the_list(self):
+        alice = User.objects.create_user("alice")
+        bob = User.objects.create_user("bob")
+        Application.objects.create(user=alice, title="Dev", company="Acme")
+        Application.objects.create(user=alice, title="Dev", company="Globex")
+        Application.objects.create(user=bob, title="Dev", company="Acme")
+
+        response = self.client.get("/admin/core/application/?company=ac&username=alice")
+
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+
+class AuthTests(APITestCase):
+    """Login, refresh and logout (core.views / core.tokens)."""
+
+    def setUp(self):
+        # Throttle buckets, revocations and active flags live in the cache.
+        cache.clear()
+        self.user = User.objects.create_user("alice", password=PASSWORD)
+
+    def login(self):
+        return self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "alice", "password": PASSWORD},
+            format="json",
+        )
+
+    def refresh(self, token):
+        return self.client.post(
+            reverse("token_refresh"), {"refresh": token}, format="json"
+        )
+
+    def test_login_returns_token_pair(self):
+        response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
+        self.assertIn("refresh", response.data)
+
+    def test_login_rehashes_outdated_password_hash(self):
+        self.user.password = make_password(PASSWORD, hasher="pbkdf2_sha1")
+        self.user.save()
+
+        self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+
+    def test_login_returns_429_when_all_slots_are_busy(self):
+        with mock.patch.object(views, "login_slots", threading.BoundedSemaphore(1)):
+            views.login_slots.acquire()
+            response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response.headers)
+
+    def test_refresh_returns_new_access_token(self):
+        response = self.refresh(self.login().data["refresh"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
+
+    def test_refresh_fails_after_user_is_deactivated(self):
+        token = self.login().data["refresh"]
+        self.refresh(token)  # caches the active flag
+
+        # Deactivated from another process (no signals, no shared cache).
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        cache.clear()
+
+        response = self.refresh(token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_fails_after_user_is_deleted(self):
+        token = self.login().data["refresh"]
+        self.user.delete()
+
+        response = self.refresh(token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_fails_after_logout(self):
+        token = self.login().data["refresh"]
+
+        response = self.client.post(
+            reverse("token_logout"), {"refresh": token}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.refresh(token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class NormalizeTests(SimpleTestCase):
+    """core.normalize"""
+
+    def test_company_drops_case_punctuation_and_suffixes(self):
+        self.assertEqual(normalize_company("Acme, Inc."), "acme")
+        self.assertEqual(normalize_company("Société Générale"), "societe generale")
+
+    def test_title_drops_case_and_punctuation(self):
+        self.assertEqual(
+            normalize_title("Sr. Backend-Engineer "), "sr backend engineer"
+        )
+
+    def test_non_latin_text_is_kept(self):
+        self.assertEqual(normalize_company("ソニー"), "ソニー")
+        self.assertEqual(normalize_title("软件工程师"), "软件工程师")
+        self.assertNotEqual(normalize_title("ゴーグル"), normalize_title("コーグル"))
+
+
+class DuplicateApplicationTests(APITestCase):
+    """The duplicate check in ApplicationSerializer."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("alice")
+        self.client.force_authenticate(self.user)
+        self.url = reverse("application-list")
+
+    def create(self, title, company):
+        return self.client.post(
+            self.url, {"title": title, "company": company}, format="json"
+        )
+
+    def test_create_rejects_same_job_after_normalizing(self):
+        self.assertEqual(
+            self.create("Backend Developer", "Acme, Inc.").status_code,
+            status.HTTP_201_CREATED,
+        )
+
+        response = self.create("backend-developer", "ACME")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_allows_same_job_for_another_user(self):
+        other = User.objects.create_user("bob")
+        Application.objects.create(user=other, title="Dev", company="Acme")
+
+        response = self.create("Dev", "Acme")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_allows_different_non_latin_jobs(self):
+        self.create("软件工程师", "ソニー")
+
+        response = self.create("设计师", "任天堂")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_status_update_works_on_existing_duplicate(self):
+        first = Application.objects.create(user=self.user, title="Dev", company="Acme")
+        Application.objects.create(user=self.user, title="Dev", company="Acme")
+
+        response = self.client.patch(
+            reverse("application-detail", args=[first.pk]),
+            {"status": "interview"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_keys_are_not_in_responses(self):
+        response = self.create("Dev", "Acme")
+
+        self.assertNotIn("company_key", response.data)
+        self.assertNotIn("title_key", response.data)
+
+    def test_keys_fit_their_columns_when_normalizing_grows_text(self):
+        # "ß" casefolds to "ss", so the normalized title is twice as long.
+        response = self.create("ß" * 200, "Acme")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        app = Application.objects.get()
+        self.assertEqual(app.title_key, "s" * 200)
+
+        response = self.create("ß" * 200, "Acme")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_update_rejects_renaming_onto_another_application(self):
+        Application.objects.create(user=self.user, title="Dev", company="Acme")
+        other = Application.objects.create(user=self.user, title="QA", company="Acme")
+
+        response = self.client.patch(
+            reverse("application-detail", args=[other.pk]),
+            {"title": "dev"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DedupeApplicationsTests(TestCase):
+    """manage.py dedupe_applications"""
+
+    def rows(self, *titles):
+        return [(pk, 1, "acme", title) for pk, title in enumerate(titles, start=1)]
+
+    def test_exact_titles_are_grouped(self):
+        groups = find_duplicates(self.rows("dev", "qa", "dev"), threshold=0.8)
+
+        self.assertEqual(groups, [[("dev", [1, 3])]])
+
+    def test_similar_titles_do_not_chain(self):
+        groups = find_duplicates(
+            self.rows(
+                "junior backend engineer",
+                "backend engineer",
+                "senior backend engineer",
+                "backend engineer ii",
+                "staff backend engineer",
+            ),
+            threshold=0.6,
+        )
+
+        # Every title in a group must be similar to every other one.
+        for group in groups:
+            for (a, _), (b, _) in combinations(group, 2):
+                self.assertGreaterEqual(similarity(trigrams(a), trigrams(b)), 0.6)
+
+    def test_delete_merges_only_exact_duplicates(self):
+        user = User.objects.create_user("alice")
+        keep = Application.objects.create(user=user, title="Dev", company="Acme")
+        extra = Application.objects.create(user=user, title="dev", company="ACME")
+        similar = Application.objects.create(user=user, title="Devs", company="Acme")
+        Contact.objects.create(application=extra, name="Bob")
+        Task.objects.create(application=extra, title="Follow up")
+
+        call_command(
+            "dedupe_applications", "--delete", "--threshold", "0.1", stdout=StringIO()
+        )
+
+        self.assertQuerySetEqual(
+            Application.objects.order_by("id"), [keep, similar], transform=lambda a: a
+        )
+        self.assertEqual(keep.contacts.count(), 1)
+        self.assertEqual(keep.tasks.count(), 1)
@@ -0,0 +1,72 @@
+import threading
+
+from rest_framework.throttling import ScopedRateThrottle
+
+# Make the read-modify-write of a bucket atomic between threads of one
+# process (see TokenBucketThrottle). Striped, so users don't all queue on
+# a single lock.
+_bucket_locks = [threading.Lock() for _ in range(64)]
+
+
+class TokenBucketThrottle(ScopedRateThrottle):
+    """
+    Rate limit per user *and* per endpoint using a token bucket.
+
+    - Each view picks its bucket with `throttle_scope` (e.g. "applications").
+    - The rate for that scope comes from `DEFAULT_THROTTLE_RATES`.
+    - A bucket holds up to N tokens and refills at N tokens per period,
+      so short bursts are fine but a tight polling loop runs dry.
+    - The bucket is just two numbers in the cache (not a list of timestamps
+      like DRF's default throttles), so it stays cheap under heavy traffic.
+
+    When the bucket is empty DRF answers with 429 and a `Retry-After` header
+    (taken from `wait()`).
+
+    Updating a bucket is a cache get + set. Threads of one process take a
+    lock around it, so they can't both spend the same token. Separate worker
+    processes sharing a cache (Redis) are not locked against each other: in
+    a burst, each worker racing on the same bucket can let one extra request
+    through, so the limit can be overshot by up to (workers - 1) requests.
+    """
+
+    cache_format = "throttle_bucket_%(scope)s_%(ident)s"
+
+    def allow_request(self, request, view):
+        # Same scope lookup as ScopedRateThrottle: no scope = no limit.
+        self.scope = getattr(view, self.scope_attr, None)
+        if not self.scope:
+            return True
+
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        with _bucket_locks[hash(self.key) % len(_bucket_locks)]:
+            return self._take_token()
+
+    def _take_token(self):
+        self.now = self.timer()
+        refill_per_second = self.num_requests / self.duration
+
+        # Start with a full bucket, then add whatever refilled since last time.
+        tokens, last_seen = self.cache.get(self.key, (self.num_requests, self.now))
+        tokens = min(
+            self.num_requests, tokens + (self.now - last_seen) * refill_per_second
+        )
+
+        if tokens < 1:
+            # Time until one whole token is back in the bucket.
+            self.retry_after = (1 - tokens) / refill_per_second
+            return self.throttle_failure()
+
+        self.cache.set(self.key, (tokens - 1, self.now), self.duration)
+        return True
+
+    def wait(self):
+        """Seconds until the next request would be allowed."""
+        return getattr(self, "retry_after", None)
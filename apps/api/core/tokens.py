@@ -0,0 +1,99 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# One key per revoked token (by its `jti`), kept until the token expires.
+# Needs a cache shared by all workers (REDIS_URL) to reach every process.
+REVOKED_TOKEN_KEY = "revoked_jti_%s"
+
+# Cached "is this user still active?" flag. Read from the DB, so it works
+# across processes; a deactivated or deleted user can refresh for at most
+# this many more seconds.
+USER_ACTIVE_KEY = "user_active_%s"
+USER_ACTIVE_TIMEOUT = 30
+
+
+def revoke_token(token):
+    """Put a single token on the revocation list until it would expire anyway."""
+    remaining = int(token["exp"] - time.time())
+    if remaining > 0:
+        cache.set(REVOKED_TOKEN_KEY % token["jti"], True, remaining)
+
+
+def check_token(payload):
+    """
+    Raise if a refresh token's claims are revoked or belong to a user who is
+    no longer active. Costs one cache round-trip, plus a one-column query
+    when the user's active flag isn't cached.
+    """
+    user_id = payload.get(api_settings.USER_ID_CLAIM)
+    token_key = REVOKED_TOKEN_KEY % payload.get("jti")
+    active_key = USER_ACTIVE_KEY % user_id
+    found = cache.get_many([token_key, active_key])
+
+    if found.get(token_key):
+        raise TokenError("Token is revoked")
+
+    active = found.get(active_key)
+    if active is None:
+        # A deleted user has no row, so `first()` gives None -> not active.
+        active = bool(
+            get_user_model()
+            .objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+            .values_list("is_active", flat=True)
+            .first()
+        )
+        cache.set(active_key, active, USER_ACTIVE_TIMEOUT)
+
+    if not active:
+        raise AuthenticationFailed(
+            TokenRefreshSerializer.default_error_messages["no_active_account"],
+            "no_active_account",
+        )
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh an access token without loading the whole user.
+
+    The stock serializer loads the user from the DB on every refresh to make
+    sure they are still active. Here we check the revocation list and a
+    short-lived cached `is_active` flag instead (see check_token).
+    """
+
+    def validate(self, attrs):
+        # Checks the signature, expiry and token type.
+        refresh = self.token_class(attrs["refresh"])
+
+        check_token(refresh.payload)
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            # The old refresh token must not be usable again.
+            revoke_token(refresh)
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+
+        return data
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    """
+    Takes a refresh token and puts it on the revocation list (logout).
+    """
+
+    refresh = serializers.CharField(write_only=True)
+
+    def validate(self, attrs):
+        revoke_token(RefreshToken(attrs["refresh"]))
+        return {}
@@ -1,8 +1,18 @@
+import threading
+
 from rest_framework import viewsets, permissions
-from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.exceptions import PermissionDenied, Throttled, ValidationError
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenViewBase
+from django.conf import settings
 from django.db.models import Prefetch
+from .coalescing import CoalescedReadMixin
 from .models import Application, Contact, Task
 from .serializers import ApplicationSerializer, ContactSerializer, TaskSerializer
+from .tokens import CachedTokenRefreshSerializer, TokenRevokeSerializer
+
+# Password hashing is slow on purpose, so only a few logins per process may
+# hash at once. A login storm can't take every thread; the rest get a 429.
+login_slots = threading.BoundedSemaphore(settings.LOGIN_MAX_CONCURRENT)
 
 
 class IsOwner(permissions.BasePermission):
@@ -28,15 +38,17 @@ class IsOwner(permissions.BasePermission):
         return False
 
 
-class ApplicationViewSet(viewsets.ModelViewSet):
+class ApplicationViewSet(CoalescedReadMixin, viewsets.ModelViewSet):
     """
     Handles CRUD (Create, Read, Update, Delete) for Applications.
     - Users only see their own applications.
     - Prefetch contacts and tasks for better performance.
+    - Identical concurrent GETs share one query (see CoalescedReadMixin).
     """
 
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    throttle_scope = "applications"
 
     def get_queryset(self):
         # Return only applications that belong to the logged-in user.
@@ -59,7 +71,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(CoalescedReadMixin, viewsets.ModelViewSet):
     """
     Handles CRUD for Contacts.
     - Users only see contacts tied to their own applications.
@@ -68,6 +80,7 @@ class ContactViewSet(viewsets.ModelViewSet):
 
     serializer_class = ContactSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    throttle_scope = "contacts"
 
     def get_queryset(self):
         # Return only contacts where the related application belongs to the user.
@@ -103,7 +116,7 @@ class ContactViewSet(viewsets.ModelViewSet):
         serializer.save(application=application)
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(CoalescedReadMixin, viewsets.ModelViewSet):
     """
     Handles CRUD for Tasks.
     - Users only see tasks tied their applications.
@@ -112,6 +125,7 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    throttle_scope = "tasks"
 
     def get_queryset(self):
         # Return only tasks where the related application belongs to the user.
@@ -137,3 +151,39 @@ class TaskViewSet(viewsets.ModelViewSet):
             )
 
         serializer.save(application=application)
+
+
+class LoginView(TokenObtainPairView):
+    """
+    Same as SimpleJWT's login, but only if a login slot is free.
+    - If all `login_slots` are busy, answer 429 right away instead of waiting.
+    - If the stored hash is outdated, Django re-hashes it on success
+      (see PASSWORD_HASHERS in settings).
+    """
+
+    def post(self, request, *args, **kwargs):
+        if not login_slots.acquire(blocking=False):
+            raise Throttled(wait=1, detail="Too many logins right now. Try again.")
+
+        try:
+            return super().post(request, *args, **kwargs)
+        finally:
+            login_slots.release()
+
+
+class RefreshView(TokenViewBase):
+    """
+    Returns a new access token for a refresh token.
+    Works from the token's claims, the cached revocation list and a cached
+    "is this user still active?" flag (see CachedTokenRefreshSerializer).
+    """
+
+    serializer_class = CachedTokenRefreshSerializer
+
+
+class LogoutView(TokenViewBase):
+    """
+    Revokes the given refresh token so it can't be used again.
+    """
+
+    serializer_class = TokenRevokeSerializer